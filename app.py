@@ -1,78 +1,22 @@
 """
 FastAPI + SQLAlchemy MVP (SQLite backend)
-"""
 
-from fastapi import Request, Form
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
+Multi-process deployment (see Procfile):
+    WEB_CONCURRENCY=$((2 * $(nproc) + 1)) \
+        gunicorn app:app -k uvicorn_worker.UvicornWorker
 
+gunicorn takes its worker count from WEB_CONCURRENCY, and the workers read
+it too: with more than one, the per-process item cache is off by default
+(see ITEM_CACHE_TTL in routers/items.py).
+"""
 
 from contextlib import asynccontextmanager
-from typing import Generator, List
-
-from fastapi import FastAPI, HTTPException, Depends
-from pydantic import BaseModel
-
-from sqlalchemy import create_engine, Column, Integer, String, Float
-from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
-
-
-# ─────────────────────────────────────────────────────────────
-# Pydantic models (request/response)
-# ─────────────────────────────────────────────────────────────
-
-class ItemCreate(BaseModel):
-    name: str
-    description: str = ""
-    price: float
-
-
-class ItemResponse(BaseModel):
-    id: int
-    name: str
-    description: str
-    price: float
-
-
-# ─────────────────────────────────────────────────────────────
-# SQLAlchemy setup
-# ─────────────────────────────────────────────────────────────
-
-DATABASE_URL = "sqlite:///./app.db"
-
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Required for SQLite + threads
-)
-
-SessionLocal = sessionmaker(
-    bind=engine,
-    autoflush=False,
-    autocommit=False,
-)
-
-
-class Base(DeclarativeBase):
-    pass
-
-
-class Item(Base):
-    __tablename__ = "items"
-
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False)
-    description = Column(String, default="")
-    price = Column(Float, nullable=False)
 
+from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
 
-def get_db() -> Generator[Session, None, None]:
-    """Dependency that yields a SQLAlchemy session."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+from database import close_db, init_db
+from routers import items
 
 
 # ─────────────────────────────────────────────────────────────
@@ -81,11 +25,12 @@ def get_db() -> Generator[Session, None, None]:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: create tables from ORM models
-    Base.metadata.create_all(bind=engine)
+    # Startup: build this worker's engine and create any missing schema
+    await init_db()
     print("SQLAlchemy: database initialized")
     yield
-    # Shutdown: optional cleanup
+    # Shutdown: release pooled connections
+    await close_db()
     print("SQLAlchemy: app shutting down")
 
 
@@ -97,11 +42,8 @@ app = FastAPI(
 # Mount /static
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Templates directory
-templates = Jinja2Templates(directory="templates")
-
 # ─────────────────────────────────────────────────────────────
-# Routes (CRUD)
+# Routes
 # ─────────────────────────────────────────────────────────────
 
 @app.get("/")
@@ -109,101 +51,9 @@ def root():
     return {"status": "ok", "message": "FastAPI + SQLAlchemy MVP"}
 
 
-@app.post("/items", response_model=ItemResponse, status_code=201)
-def create_item(
-    item: ItemCreate,
-    db: Session = Depends(get_db),
-):
-    db_item = Item(
-        name=item.name,
-        description=item.description,
-        price=item.price,
-    )
-    db.add(db_item)
-    db.commit()
-    db.refresh(db_item)
-    return db_item
-
-
-@app.get("/items", response_model=List[ItemResponse])
-def read_items(db: Session = Depends(get_db)):
-    items = db.query(Item).all()
-    return items
-
-
-@app.get("/items/{item_id}", response_model=ItemResponse)
-def read_item(item_id: int, db: Session = Depends(get_db)):
-    item = db.query(Item).filter(Item.id == item_id).first()
-    if item is None:
-        raise HTTPException(status_code=404, detail="Item not found")
-    return item
-
-
-@app.put("/items/{item_id}", response_model=ItemResponse)
-def update_item(
-    item_id: int,
-    item: ItemCreate,
-    db: Session = Depends(get_db),
-):
-    db_item = db.query(Item).filter(Item.id == item_id).first()
-    if db_item is None:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    db_item.name = item.name
-    db_item.description = item.description
-    db_item.price = item.price
-
-    db.commit()
-    db.refresh(db_item)
-    return db_item
-
-
-@app.delete("/items/{item_id}")
-def delete_item(item_id: int, db: Session = Depends(get_db)):
-    db_item = db.query(Item).filter(Item.id == item_id).first()
-    if db_item is None:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    db.delete(db_item)
-    db.commit()
-    return {"detail": "Item deleted"}
-
-
-@app.get("/items/ui", response_class=HTMLResponse)
-async def items_page(
-    request: Request,
-    db: Session = Depends(get_db),
-):
-    items = db.query(Item).all()
-    return templates.TemplateResponse(
-        "items_list.html",
-        {
-            "request": request,
-            "items": items,
-        },
-    )
-
-
-@app.post("/items/ui")
-async def create_item_from_form(
-    name: str = Form(...),
-    description: str = Form(""),
-    price: float = Form(...),
-    db: Session = Depends(get_db),
-):
-    db_item = Item(
-        name=name,
-        description=description,
-        price=price,
-    )
-    db.add(db_item)
-    db.commit()
-    db.refresh(db_item)
-
-    # Redirect back to the list page (303 to avoid form resubmit)
-    return RedirectResponse(url="/items/ui", status_code=303)
+app.include_router(items.router)
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000)
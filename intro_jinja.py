@@ -1,18 +1,37 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
+from jinja2 import FileSystemBytecodeCache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile templates once at startup instead of on the first request
+    templates.get_template("hello.html")
+    yield
 
-app = FastAPI(title="Jinja2 Intro")
+
+app = FastAPI(title="Jinja2 Intro", lifespan=lifespan)
 
 # Mount static files directory
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Configure templates directory
 templates = Jinja2Templates(directory="templates")
-async def hello(request: Request, name: str = “Student”):
-    #“request” key is required by FastAPI/Starlette templates
+# Templates don't change while the app runs: skip the mtime check on every
+# render and keep compiled bytecode on disk across restarts
+templates.env.auto_reload = False
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+
+@app.get("/hello", response_class=HTMLResponse)
+async def hello(request: Request, name: str = "Student"):
+    # The request is passed first; Starlette adds it to the template context
     return templates.TemplateResponse(
+        request,
         "hello.html",
-        {“request”: request, “name”: name},
-    )
\ No newline at end of file
+        {"name": name},
+    )
@@ -0,0 +1,326 @@
+"""
+Item CRUD routes (JSON API and the HTML list/form)
+"""
+
+import hashlib
+import os
+from typing import List, Optional
+
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
+from fastapi.responses import (
+    HTMLResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
+from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel
+from sqlalchemy import bindparam, delete, insert, lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from database import Item, get_db, get_ro_conn, ro_connect
+
+
+router = APIRouter()
+
+# Templates directory
+templates = Jinja2Templates(directory="templates")
+
+
+# ─────────────────────────────────────────────────────────────
+# Pydantic models (request/response)
+# ─────────────────────────────────────────────────────────────
+
+class ItemCreate(BaseModel):
+    name: str
+    description: str = ""
+    price: float
+
+
+class ItemResponse(BaseModel):
+    id: int
+    name: str
+    description: str
+    price: float
+
+
+# ─────────────────────────────────────────────────────────────
+# Statements
+# ─────────────────────────────────────────────────────────────
+
+# Column-only selects for the hot read paths: no ORM objects are built
+ITEM_COLUMNS = (Item.id, Item.name, Item.description, Item.price)
+
+# lambda_stmt caches the compiled SQL by lambda identity, so repeat calls
+# skip both statement construction and the cache-key walk
+GET_ITEM = lambda_stmt(
+    lambda: select(*ITEM_COLUMNS).where(Item.id == bindparam("item_id"))
+)
+
+# Single-statement writes: rowcount tells us whether the item existed
+UPDATE_ITEM = lambda_stmt(
+    lambda: update(Item)
+    .where(Item.id == bindparam("item_id"))
+    .values(
+        name=bindparam("new_name"),
+        description=bindparam("new_description"),
+        price=bindparam("new_price"),
+    )
+    .execution_options(synchronize_session=False)
+)
+
+DELETE_ITEM = lambda_stmt(
+    lambda: delete(Item)
+    .where(Item.id == bindparam("item_id"))
+    .execution_options(synchronize_session=False)
+)
+
+
+# ─────────────────────────────────────────────────────────────
+# In-process read cache
+# ─────────────────────────────────────────────────────────────
+
+# The cache lives in each process and only a write handled by that process
+# invalidates it, so under N workers another worker may serve an item up
+# to ITEM_CACHE_TTL seconds stale. It is therefore off by default whenever
+# WEB_CONCURRENCY (gunicorn's worker count) is above 1; setting
+# ITEM_CACHE_TTL explicitly opts back in and accepts that window.
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+ITEM_CACHE_TTL = int(
+    os.getenv("ITEM_CACHE_TTL", "60" if WEB_CONCURRENCY <= 1 else "0")
+)
+
+# JSON-encoded item bodies keyed by item id
+item_cache: TTLCache = TTLCache(maxsize=10_000, ttl=ITEM_CACHE_TTL)
+
+# Bumped on every write, so readers can tell a write overlapped their query
+items_version = 0
+
+
+def invalidate_items(item_id: Optional[int] = None) -> None:
+    """Drop cached data for a written item and bump the items version."""
+    global items_version
+    items_version += 1
+    if item_id is not None:
+        item_cache.pop(item_id, None)
+
+
+def cache_item(item_id: int, body: bytes, version_seen: int) -> None:
+    """Cache body unless a write happened since version_seen was read.
+
+    A read that raced a write may hold the pre-write row; caching it would
+    serve the old item until the entry expires.
+    """
+    if ITEM_CACHE_TTL > 0 and version_seen == items_version:
+        item_cache[item_id] = body
+
+
+def json_response(request: Request, body: bytes) -> Response:
+    """Send JSON body with an ETag hashed from it, or 304 if the client has it.
+
+    Deriving the ETag from the bytes (not a counter) means a 304 is only
+    ever sent for content identical to what the client holds.
+    """
+    etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+    held = request.headers.get("if-none-match", "")
+    tags = {tag.strip().removeprefix("W/") for tag in held.split(",")}
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+# ─────────────────────────────────────────────────────────────
+# Bulk loading
+# ─────────────────────────────────────────────────────────────
+
+# Batches at least this large go through COPY when the backend supports it
+COPY_THRESHOLD = 100
+
+COPY_COLUMNS = ("name", "description", "price")
+
+
+def can_copy(db: AsyncSession, row_count: int) -> bool:
+    """True when a batch should be loaded with PostgreSQL's native COPY."""
+    dialect = db.get_bind().dialect
+    return (
+        row_count >= COPY_THRESHOLD
+        and dialect.name == "postgresql"
+        and dialect.driver == "asyncpg"
+    )
+
+
+async def copy_items(db: AsyncSession, rows: List[dict]) -> None:
+    """Load rows into items with asyncpg's COPY instead of INSERTs."""
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        Item.__tablename__,
+        records=[tuple(row[col] for col in COPY_COLUMNS) for row in rows],
+        columns=COPY_COLUMNS,
+    )
+
+
+# ─────────────────────────────────────────────────────────────
+# Routes (CRUD)
+# ─────────────────────────────────────────────────────────────
+
+@router.post("/items", response_model=ItemResponse, status_code=201)
+async def create_item(
+    item: ItemCreate,
+    db: AsyncSession = Depends(get_db),
+):
+    values = item.model_dump()
+    if db.get_bind().dialect.insert_returning:
+        # INSERT ... RETURNING hands back the new id in the same round trip
+        result = await db.execute(insert(Item).returning(Item.id), values)
+        new_id = result.scalar_one()
+    else:
+        # SQLite < 3.35 has no RETURNING; fall back to the cursor's lastrowid
+        result = await db.execute(insert(Item.__table__), values)
+        new_id = result.inserted_primary_key[0]
+    await db.commit()
+    invalidate_items()
+    return {"id": new_id, **values}
+
+
+@router.post("/items/bulk", status_code=201)
+async def create_items_bulk(
+    items: List[ItemCreate],
+    db: AsyncSession = Depends(get_db),
+):
+    # COPY on PostgreSQL, otherwise one batched INSERT (insertmanyvalues);
+    # either way a single commit for the lot
+    if items:
+        rows = [item.model_dump() for item in items]
+        if can_copy(db, len(rows)):
+            await copy_items(db, rows)
+        else:
+            await db.execute(insert(Item), rows)
+        await db.commit()
+        invalidate_items()
+    return {"inserted": len(items)}
+
+
+# Read routes encode rows with orjson themselves and skip FastAPI's
+# response_model pipeline; `responses` keeps the schema in the OpenAPI docs
+@router.get("/items", responses={200: {"model": List[ItemResponse]}})
+async def read_items(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000),
+    after_id: int = 0,
+    conn: AsyncConnection = Depends(get_ro_conn),
+):
+    # Keyset pagination: pass the last id seen as after_id for the next page
+    stmt = lambda_stmt(
+        lambda: select(*ITEM_COLUMNS)
+        .where(Item.id > after_id)
+        .order_by(Item.id)
+        .limit(limit)
+    )
+    result = await conn.execute(stmt)
+    return json_response(request, orjson.dumps([row._asdict() for row in result]))
+
+
+@router.get("/items/export")
+async def export_items():
+    """Stream every item as NDJSON, holding at most one batch in memory."""
+
+    async def rows():
+        # Own connection: the response body outlives the request dependencies
+        async with ro_connect() as conn:
+            stmt = select(*ITEM_COLUMNS).order_by(Item.id)
+            result = await conn.stream(stmt.execution_options(yield_per=500))
+            async for row in result:
+                yield orjson.dumps(row._asdict()) + b"\n"
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+
+# Registered before /items/{item_id} so "ui" isn't taken for an item id
+@router.get("/items/ui", response_class=HTMLResponse)
+async def items_page(
+    request: Request,
+    conn: AsyncConnection = Depends(get_ro_conn),
+):
+    result = await conn.execute(select(*ITEM_COLUMNS).order_by(Item.id))
+    items = result.all()
+    return templates.TemplateResponse(
+        request,
+        "items_list.html",
+        {"items": items},
+    )
+
+
+@router.post("/items/ui")
+async def create_item_from_form(
+    name: str = Form(...),
+    description: str = Form(""),
+    price: float = Form(...),
+    db: AsyncSession = Depends(get_db),
+):
+    db_item = Item(
+        name=name,
+        description=description,
+        price=price,
+    )
+    db.add(db_item)
+    await db.commit()
+    invalidate_items()
+
+    # Redirect back to the list page (303 to avoid form resubmit)
+    return RedirectResponse(url="/items/ui", status_code=303)
+
+
+@router.get("/items/{item_id}", responses={200: {"model": ItemResponse}})
+async def read_item(
+    item_id: int,
+    request: Request,
+    conn: AsyncConnection = Depends(get_ro_conn),
+):
+    body = item_cache.get(item_id)
+    if body is None:
+        version_seen = items_version
+        result = await conn.execute(GET_ITEM, {"item_id": item_id})
+        row = result.one_or_none()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+        body = orjson.dumps(row._asdict())
+        cache_item(item_id, body, version_seen)
+
+    return json_response(request, body)
+
+
+@router.put("/items/{item_id}", response_model=ItemResponse)
+async def update_item(
+    item_id: int,
+    item: ItemCreate,
+    db: AsyncSession = Depends(get_db),
+):
+    result = await db.execute(
+        UPDATE_ITEM,
+        {
+            "item_id": item_id,
+            "new_name": item.name,
+            "new_description": item.description,
+            "new_price": item.price,
+        },
+    )
+    await db.commit()
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    invalidate_items(item_id)
+    return {"id": item_id, **item.model_dump()}
+
+
+@router.delete("/items/{item_id}")
+async def delete_item(item_id: int, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(DELETE_ITEM, {"item_id": item_id})
+    await db.commit()
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    invalidate_items(item_id)
+    return {"detail": "Item deleted"}
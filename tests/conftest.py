@@ -0,0 +1,29 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# database.py reads DATABASE_URL at import; point it at a throwaway file
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/test.db"
+os.environ.pop("WEB_CONCURRENCY", None)
+
+# app.py mounts static/ and templates/ relative to the working directory
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+
+@pytest.fixture
+def client():
+    from fastapi.testclient import TestClient
+
+    import app
+    from routers import items
+
+    items.item_cache.clear()
+    with TestClient(app.app) as c:
+        yield c
@@ -0,0 +1,230 @@
+import sqlite3
+from types import SimpleNamespace
+
+import orjson
+from fastapi import Request
+from fastapi.testclient import TestClient
+
+import app
+import database
+from routers import items
+
+
+def create(client, name="widget", price=1.5):
+    r = client.post("/items", json={"name": name, "price": price})
+    assert r.status_code == 201
+    return r.json()["id"]
+
+
+def test_read_item_304_when_etag_matches(client):
+    item_id = create(client)
+    r = client.get(f"/items/{item_id}")
+    etag = r.headers["etag"]
+
+    r = client.get(f"/items/{item_id}", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.headers["etag"] == etag
+
+    # Weak and list forms of the same tag match too
+    r = client.get(
+        f"/items/{item_id}", headers={"If-None-Match": f'"x", W/{etag}'}
+    )
+    assert r.status_code == 304
+
+
+def test_read_item_200_after_update(client):
+    item_id = create(client)
+    old_etag = client.get(f"/items/{item_id}").headers["etag"]
+
+    client.put(f"/items/{item_id}", json={"name": "renamed", "price": 2})
+
+    r = client.get(f"/items/{item_id}", headers={"If-None-Match": old_etag})
+    assert r.status_code == 200
+    assert r.json()["name"] == "renamed"
+    assert r.headers["etag"] != old_etag
+
+
+def request_with(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+def test_json_response_etag_follows_bytes():
+    first = items.json_response(request_with(), b'{"name": "a"}')
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    same = items.json_response(request_with(etag), b'{"name": "a"}')
+    assert same.status_code == 304
+    assert same.headers["etag"] == etag
+
+    changed = items.json_response(request_with(etag), b'{"name": "b"}')
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.body == b'{"name": "b"}'
+
+
+def test_read_items_etag_tracks_content(client):
+    create(client)
+    etag = client.get("/items").headers["etag"]
+    assert client.get("/items", headers={"If-None-Match": etag}).status_code == 304
+
+    create(client, name="another")
+    assert client.get("/items", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_cache_fill_skipped_when_write_overlaps_read():
+    items.item_cache.clear()
+    version_seen = items.items_version
+    # A write commits while the read's SELECT is in flight
+    items.invalidate_items(1)
+
+    items.cache_item(1, b'{"name": "old"}', version_seen)
+    assert 1 not in items.item_cache
+
+    items.cache_item(1, b'{"name": "new"}', items.items_version)
+    assert items.item_cache[1] == b'{"name": "new"}'
+
+
+def stat_rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT idx FROM sqlite_stat1 WHERE tbl = 'items'"
+        ).fetchall()
+
+
+def test_restart_with_rows_collects_planner_stats():
+    with TestClient(app.app) as c:
+        c.post("/items/bulk", json=[{"name": "n", "price": 1}] * 20)
+    db_path = database.engine.url.database
+
+    # As after a first boot that analyzed the table while it was still empty
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM sqlite_stat1 WHERE tbl = 'items'")
+    assert stat_rows(db_path) == []
+
+    with TestClient(app.app):
+        pass
+    assert stat_rows(db_path)
+
+
+def test_items_page_lists_item_created_from_form(client):
+    r = client.post(
+        "/items/ui",
+        data={"name": "from-form", "price": "3.50"},
+        follow_redirects=False,
+    )
+    assert r.status_code == 303
+    assert r.headers["location"] == "/items/ui"
+
+    r = client.get("/items/ui")
+    assert r.status_code == 200
+    assert "from-form" in r.text
+
+
+def test_update_missing_item_404(client):
+    r = client.put("/items/999999", json={"name": "x", "price": 1})
+    assert r.status_code == 404
+
+
+def test_update_existing_item_returns_submitted_body(client):
+    item_id = create(client)
+    body = {"name": "renamed", "description": "new", "price": 2.5}
+
+    r = client.put(f"/items/{item_id}", json=body)
+    assert r.status_code == 200
+    assert r.json() == {"id": item_id, **body}
+    assert client.get(f"/items/{item_id}").json() == {"id": item_id, **body}
+
+
+def test_delete_item_then_404(client):
+    item_id = create(client)
+
+    r = client.delete(f"/items/{item_id}")
+    assert r.status_code == 200
+    assert r.json() == {"detail": "Item deleted"}
+
+    assert client.delete(f"/items/{item_id}").status_code == 404
+    assert client.get(f"/items/{item_id}").status_code == 404
+
+
+def test_delete_missing_item_404(client):
+    assert client.delete("/items/999999").status_code == 404
+
+
+def page_through(client, limit):
+    pages, after_id = [], 0
+    while True:
+        page = client.get(f"/items?limit={limit}&after_id={after_id}").json()
+        if not page:
+            return pages
+        pages.append([item["id"] for item in page])
+        after_id = page[-1]["id"]
+
+
+def test_read_items_keyset_pages_do_not_overlap(client):
+    rows = [{"name": f"p{i}", "price": i} for i in range(25)]
+    client.post("/items/bulk", json=rows)
+
+    pages = page_through(client, limit=7)
+    ids = [item_id for page in pages for item_id in page]
+
+    assert len(pages) > 1
+    assert all(len(page) <= 7 for page in pages)
+    assert len(ids) == len(set(ids))
+    assert ids == sorted(ids)
+    # Each page starts after the previous one ended (not a cached first page)
+    assert all(a[-1] < b[0] for a, b in zip(pages, pages[1:]))
+    names = {item["name"] for item in client.get("/items?limit=1000").json()}
+    assert {f"p{i}" for i in range(25)} <= names
+
+
+def test_read_items_limit_bounds(client):
+    assert client.get("/items?limit=0").status_code == 422
+    assert client.get("/items?limit=1001").status_code == 422
+    assert client.get("/items?limit=1000").status_code == 200
+
+
+def test_export_streams_every_item_as_ndjson(client):
+    rows = [{"name": f"e{i}", "price": i} for i in range(5)]
+    client.post("/items/bulk", json=rows)
+
+    r = client.get("/items/export")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    exported = [orjson.loads(line) for line in r.text.splitlines()]
+
+    pages = page_through(client, limit=1000)
+    paged = [item_id for page in pages for item_id in page]
+    assert [item["id"] for item in exported] == paged
+    assert {f"e{i}" for i in range(5)} <= {item["name"] for item in exported}
+
+
+def stub_session(name, driver):
+    dialect = SimpleNamespace(name=name, driver=driver)
+    return SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=dialect))
+
+
+def test_can_copy_only_for_large_asyncpg_batches():
+    assert not items.can_copy(stub_session("sqlite", "aiosqlite"), 500)
+    assert not items.can_copy(stub_session("postgresql", "asyncpg"), 99)
+    assert items.can_copy(stub_session("postgresql", "asyncpg"), 100)
+    assert not items.can_copy(stub_session("postgresql", "psycopg"), 500)
+
+
+def test_bulk_insert_on_sqlite(client):
+    before = len(client.get("/items?limit=1000").json())
+    rows = [{"name": f"b{i}", "price": i} for i in range(150)]
+
+    r = client.post("/items/bulk", json=rows)
+    assert r.status_code == 201
+    assert r.json() == {"inserted": 150}
+    assert len(client.get("/items?limit=1000").json()) == before + 150
+
+
+def test_bulk_insert_empty_list(client):
+    r = client.post("/items/bulk", json=[])
+    assert r.status_code == 201
+    assert r.json() == {"inserted": 0}